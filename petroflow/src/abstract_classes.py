@@ -139,6 +139,10 @@ class AbstractWell(AbstractWellSegment):
     def drop_nans(self):
         pass
 
+    @abstractmethod
+    def apply_segment_transforms(self):
+        pass
+
     @abstractmethod
     def aggregate(self):
         pass
@@ -1,6 +1,7 @@
 """Implements base delegator - a metaclass that creates absent abstract
 methods of `WellBatch` and `Well` classes."""
 
+import linecache
 from abc import ABCMeta
 
 
@@ -21,3 +22,32 @@ class BaseDelegator(ABCMeta):
         """Create a method, absent in the `namespace`. Must be overridden in
         child classes."""
         raise NotImplementedError
+
+    @classmethod
+    def _compile_delegator(mcls, template, name):
+        """Create a `delegator` function from its source `template` with a
+        delegated method `name` substituted in it, so that the method is
+        accessed directly rather than looked up by name on each call. The
+        source is registered in `linecache` to be shown in tracebacks.
+
+        Parameters
+        ----------
+        template : str
+            Source code of a `delegator` function with `{name}` placeholders.
+        name : str
+            Name of a delegated method.
+
+        Returns
+        -------
+        delegator : callable
+            Created function.
+        """
+        if not name.isidentifier():
+            raise ValueError("Method name must be a valid identifier, but {} was given".format(name))
+        source = template.format(name=name)
+        filename = "<{} delegator {}>".format(mcls.__name__, name)
+        code = compile(source, filename, "exec")
+        linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+        namespace = {}
+        exec(code, {}, namespace)  # pylint: disable=exec-used
+        return namespace["delegator"]
@@ -2,9 +2,10 @@
 # pylint: disable=abstract-method
 
 import warnings
-from copy import copy, deepcopy
+from copy import deepcopy
 from functools import wraps
-from collections import defaultdict, Counter
+from operator import methodcaller
+from collections import defaultdict
 
 import numpy as np
 import pandas as pd
@@ -25,47 +26,48 @@ class SegmentDelegatingMeta(BaseDelegator):
         delegate_fn = getattr(mcls, namespace["delegators"][method])
         namespace[method] = delegate_fn(method)
 
-    @staticmethod
-    def segment_delegator(name):
+    @classmethod
+    def segment_delegator(mcls, name):
         """Delegate the call to each segment of a `Well`. Acts as the default
-        delegator."""
-        @wraps(getattr(WellSegment, name))
-        def delegator(self, *args, **kwargs):
-            results = []
-            for segment in self:
-                res = getattr(segment, name)(*args, **kwargs)
-                if not isinstance(res, list):
-                    res = [res]
-                results.extend(res)
-            res_well = self.copy()
-            res_well.segments = results
-            return res_well
-        return delegator
+        delegator. The method must return a single segment."""
+        # All children of a node have the same type, so the method is looked up only once
+        template = """
+def delegator(self, *args, **kwargs):
+    segments = self.segments
+    method = type(segments[0]).{name} if segments else None
+    results = [method(segment, *args, **kwargs) for segment in segments]
+    res_well = self.copy()
+    res_well.segments = results
+    return res_well
+"""
+        delegator = mcls._compile_delegator(template, name)
+        return wraps(getattr(WellSegment, name))(delegator)
 
-    @staticmethod
-    def aggregating_delegator(name):
+    @classmethod
+    def aggregating_delegator(mcls, name):
         """If `aggregate` is `False`, delegate the call to each segment of a
         `Well`. Otherwise, aggregate the `Well` and call the method."""
-        @wraps(getattr(WellSegment, name))
-        def delegator(self, *args, aggregate=True, **kwargs):
-            segments = [self.aggregated_segment] if aggregate else self.iter_level()
-            for segment in segments:
-                getattr(segment, name)(*args, **kwargs)
-            return self
-        return delegator
+        template = """
+def delegator(self, *args, aggregate=True, **kwargs):
+    segments = [self.aggregated_segment] if aggregate else self.iter_level()
+    for segment in segments:
+        segment.{name}(*args, **kwargs)
+    return self
+"""
+        delegator = mcls._compile_delegator(template, name)
+        return wraps(getattr(WellSegment, name))(delegator)
 
-    @staticmethod
-    def well_delegator(name):
+    @classmethod
+    def well_delegator(mcls, name):
         """Delegate the call to each segment of a `Well` and create new
         `Well`s from the corresponding results. Increases the depth of the
         segment tree."""
-        @wraps(getattr(WellSegment, name))
-        def delegator(self, *args, **kwargs):
-            wells = self.iter_level(-2)
-            for well in wells:
-                well.segments = [type(self)(segments=getattr(segment, name)(*args, **kwargs)) for segment in well]
-            return self.prune()
-        return delegator
+        template = """
+def delegator(self, *args, **kwargs):
+    return self._apply_segment_pipeline([lambda segment: segment.{name}(*args, **kwargs)]).prune()
+"""
+        delegator = mcls._compile_delegator(template, name)
+        return wraps(getattr(WellSegment, name))(delegator)
 
 
 def add_segment_properties(cls):
@@ -135,6 +137,8 @@ class Well(AbstractWell, metaclass=SegmentDelegatingMeta):
         other tree nodes are instances of `Well` class.
     """
 
+    __slots__ = ("_segments", "_level_cache", "_tree_depth", "_tree_version", "_cache_version")
+
     # delegator type depending on action name
     delegators = defaultdict(
         lambda: "segment_delegator",
@@ -147,13 +151,85 @@ class Well(AbstractWell, metaclass=SegmentDelegatingMeta):
         drop_nans="well_delegator",
     )
 
+    # `WellSegment` methods, which split a segment into a list of segments
+    # and can be fused by `apply_segment_transforms`
+    segment_transforms = frozenset({
+        "crop",
+        "drop_layers",
+        "keep_layers",
+        "keep_matched_sequences",
+        "create_segments",
+        "drop_nans",
+    })
+
     def __init__(self, *args, segments=None, **kwargs):
         super().__init__()
+        self._level_cache = {}
+        self._tree_depth = None
+        # A single-element list with a version of the segment tree, shared by all its wells
+        self._tree_version = [0]
+        self._cache_version = None
         if segments is None:
             self.segments = [WellSegment(*args, **kwargs)]
         else:
             self.segments = segments
 
+    @property
+    def segments(self):
+        """list of WellSegment or Well: Children of the tree root."""
+        return self._segments
+
+    @segments.setter
+    def segments(self, segments):
+        self._set_segments(segments)
+        self._share_tree_version(segments)
+
+    def _set_segments(self, segments):
+        """Set `segments`, whose `Well` instances already use the tree version
+        of `self`, e.g. were created by `_from_segments` or taken from the
+        same tree."""
+        # Bumping the version of the tree invalidates caches of all ancestors of the well
+        self._tree_version[0] += 1
+        self._segments = segments
+        self._level_cache = {}
+        self._tree_depth = None
+
+    def _share_tree_version(self, segments):
+        """Make `Well` instances from `segments` and their descendants use
+        the tree version of `self`."""
+        tree_version = self._tree_version
+        for well in segments:
+            if isinstance(well, Well) and well._tree_version is not tree_version:  # pylint: disable=protected-access
+                well._tree_version = tree_version  # pylint: disable=protected-access
+                well._share_tree_version(well.segments)  # pylint: disable=protected-access
+
+    @classmethod
+    def _from_segments(cls, segments, tree_version):
+        """Create a `Well` with given `segments` as a part of a segment tree,
+        whose version is `tree_version`. `Well` instances from `segments` must
+        already use the same tree version.
+
+        Parameters
+        ----------
+        segments : list of WellSegment or Well instances
+            Segments to put into `segments` attribute.
+        tree_version : list
+            Tree version of the tree the well will be added to.
+
+        Returns
+        -------
+        well : Well
+            A well with given `segments`.
+        """
+        # pylint: disable=protected-access
+        well = object.__new__(cls)
+        well._segments = segments
+        well._level_cache = {}
+        well._tree_depth = None
+        well._tree_version = tree_version
+        well._cache_version = None
+        return well
+
     @property
     def name(self):
         """str: Well name."""
@@ -170,9 +246,15 @@ class Well(AbstractWell, metaclass=SegmentDelegatingMeta):
         `WellSegment` instances. Initial depth of a created `Well` is 2: a
         root and a single segment.
         """
-        if all(isinstance(item, WellSegment) for item in self):
-            return 2
-        return self.segments[0].tree_depth + 1
+        self._check_cache()
+        if self._tree_depth is None:
+            tree_depth = 2
+            well = self
+            while well.segments and not isinstance(well.segments[0], WellSegment):
+                well = well.segments[0]
+                tree_depth += 1
+            self._tree_depth = tree_depth
+        return self._tree_depth
 
     @property
     def length(self):
@@ -182,12 +264,12 @@ class Well(AbstractWell, metaclass=SegmentDelegatingMeta):
     @property
     def depth_from(self):
         """float: Top of the well in centimeters."""
-        return min([well.depth_from for well in self])
+        return min([segment.depth_from for segment in self.iter_level()])
 
     @property
     def depth_to(self):
         """float: Bottom of the well in centimeters."""
-        return max([well.depth_to for well in self])
+        return max([segment.depth_to for segment in self.iter_level()])
 
     @property
     def n_segments(self):
@@ -195,6 +277,13 @@ class Well(AbstractWell, metaclass=SegmentDelegatingMeta):
         the segment tree."""
         return len(self.iter_level())
 
+    @property
+    def _segment_lengths(self):
+        """1-D ndarray: Lengths of the children of the tree root in
+        centimeters."""
+        return np.fromiter((segment.length for segment in self.segments), dtype=np.float64,
+                           count=len(self.segments))
+
     @property
     def aggregated_segment(self):
         """WellSegment: The only segment of an aggregated copy of the well."""
@@ -205,6 +294,15 @@ class Well(AbstractWell, metaclass=SegmentDelegatingMeta):
         for segment in self.segments:
             yield segment
 
+    def _check_cache(self):
+        """Reset cached properties of the segment tree if the tree has changed
+        since they were computed."""
+        tree_version = self._tree_version[0]
+        if self._cache_version != tree_version:
+            self._level_cache = {}
+            self._tree_depth = None
+            self._cache_version = tree_version
+
     def iter_level(self, level=-1):
         """Iterate over segments at some fixed level of the segment tree.
 
@@ -216,20 +314,30 @@ class Well(AbstractWell, metaclass=SegmentDelegatingMeta):
         Returns
         -------
         segments : list of WellSegment or Well
-            Segments from given level.
+            Segments from given level. The list is cached until the segment
+            tree is changed and must not be modified inplace.
         """
-        level = level if level >= 0 else self.tree_depth + level
-        if (level < 0) or (level > self.tree_depth):
-            raise ValueError("Level ({}) can't be negative or exceed tree depth ({})".format(level, self.tree_depth))
+        tree_depth = self.tree_depth
+        level = level if level >= 0 else tree_depth + level
+        if (level < 0) or (level > tree_depth):
+            raise ValueError("Level ({}) can't be negative or exceed tree depth ({})".format(level, tree_depth))
         if level == 0:
             return [self]
         if level == 1:
             return self.segments
-        return [item for well in self for item in well.iter_level(level - 1)]
+
+        level_cache = self._level_cache
+        if level not in level_cache:
+            items = self.segments
+            for i in range(2, level + 1):
+                if i not in level_cache:
+                    level_cache[i] = [item for well in items for item in well.segments]
+                items = level_cache[i]
+        return level_cache[level]
 
     def _prune(self):
         """Recursively prune segment tree."""
-        self.segments = [well for well in self if isinstance(well, WellSegment) or well.n_segments > 0]
+        self._set_segments([well for well in self if isinstance(well, WellSegment) or well.n_segments > 0])
         for well in self:
             if isinstance(well, Well):
                 well._prune() # pylint: disable=protected-access
@@ -256,7 +364,15 @@ class Well(AbstractWell, metaclass=SegmentDelegatingMeta):
         self : AbstractWell
             Shallow copy.
         """
-        return copy(self)
+        # pylint: disable=protected-access
+        res = object.__new__(type(self))
+        res._segments = self._segments
+        res._level_cache = {}
+        res._tree_depth = self._tree_depth
+        res._tree_version = self._tree_version
+        res._cache_version = self._cache_version
+        res.__dict__.update(self.__dict__)
+        return res
 
     def deepcopy(self):
         """Perform a deep copy of an object.
@@ -327,12 +443,18 @@ class Well(AbstractWell, metaclass=SegmentDelegatingMeta):
         res_well.segments = results
         return res_well
 
-    def _check_segment_lengths(self, length):
-        """Check that all segments of `self` are not shorter than `length`."""
-        if any(seg.length < length for seg in self.iter_level()):
+    @staticmethod
+    def _check_segment_length(segment, length):
+        """Check that `segment` is not shorter than `length`."""
+        if segment.length < length:
             err_msg = "A segment, shorter than {} exists. Try calling drop_short_segments first.".format(length)
             raise ValueError(err_msg)
 
+    def _check_segment_lengths(self, length):
+        """Check that all segments of `self` are not shorter than `length`."""
+        for segment in self.iter_level():
+            self._check_segment_length(segment, length)
+
     def crop(self, length, step, drop_last=False, fill_value=0):
         """Create crops from segments at the last level. All cropped segments
         have the same length and are cropped with some fixed step. The tree
@@ -363,14 +485,94 @@ class Well(AbstractWell, metaclass=SegmentDelegatingMeta):
         length = parse_depth(length, check_positive=True, var_name="length")
         if drop_last:
             self._check_segment_lengths(length)
+        return self._apply_segment_pipeline([methodcaller("crop", length, step, drop_last, fill_value)])
+
+    def _get_crop_transform(self, length, step, drop_last=False, fill_value=0, is_first=False):
+        """Get a transform for `apply_segment_transforms`, which crops a
+        segment with the same checks as `crop` does. If the transform is the
+        first one, segment lengths are checked right away, otherwise - for
+        each segment being cropped."""
+        length = parse_depth(length, check_positive=True, var_name="length")
+        crop = methodcaller("crop", length, step, drop_last, fill_value)
+        if not drop_last:
+            return crop
+        if is_first:
+            self._check_segment_lengths(length)
+            return crop
+
+        def checked_crop(segment):
+            self._check_segment_length(segment, length)
+            return crop(segment)
+        return checked_crop
+
+    def _apply_segment_pipeline(self, transforms):
+        """Apply a sequence of `transforms` to each segment at the last level
+        of the tree in a single pass. Each transform takes a `WellSegment` and
+        returns a list of `WellSegment` instances, increasing the tree depth
+        by one.
+
+        Parameters
+        ----------
+        transforms : list of callable
+            Transforms to apply.
+
+        Returns
+        -------
+        self : AbstractWell
+            The well with transformed segments.
+        """
+        # pylint: disable=protected-access
+        well_type = type(self)
+        tree_version = self._tree_version
+
+        def apply_transforms(segment, transforms):
+            segments = transforms[0](segment)
+            if len(transforms) > 1:
+                segments = [apply_transforms(segment, transforms[1:]) for segment in segments]
+            return well_type._from_segments(segments, tree_version)
+
+        # All segments are transformed before any changes, so that the tree stays intact if a transform fails.
+        # New wells are created as a part of the tree, so there is no need to make them share its version.
         wells = self.iter_level(-2)
-        for well in wells:
-            well.segments = [
-                Well(segments=segment.crop(length, step, drop_last, fill_value))
-                for segment in well
-            ]
+        wells_segments = [[apply_transforms(segment, transforms) for segment in well] for well in wells]
+        for well, segments in zip(wells, wells_segments):
+            well._set_segments(segments)
         return self
 
+    def apply_segment_transforms(self, transforms):
+        """Apply several `WellSegment` methods, splitting a segment into a
+        list of segments, to each segment at the last level of the tree. The
+        resulting segments are the same as of consecutive calls of the
+        corresponding `Well` methods, but the tree is traversed and rebuilt
+        only once. Each method increases the tree depth by one. Unlike `crop`,
+        branches of the tree without segments at the last level will always
+        be dropped.
+
+        Parameters
+        ----------
+        transforms : list of str or tuple
+            Methods to apply. Each item is either a method name or a tuple of
+            a method name and a `dict` of its keyword arguments. Only methods
+            from `segment_transforms` are supported.
+
+        Returns
+        -------
+        self : AbstractWell
+            The well with transformed segments.
+        """
+        methods = []
+        for transform in transforms:
+            name, kwargs = (transform, {}) if isinstance(transform, str) else transform
+            if name not in self.segment_transforms:
+                raise ValueError("Unknown segment transform {}".format(name))
+            if name == "crop":
+                methods.append(self._get_crop_transform(**kwargs, is_first=not methods))
+            else:
+                methods.append(methodcaller(name, **kwargs))
+        if not methods:
+            return self
+        return self._apply_segment_pipeline(methods).prune()
+
     def random_crop(self, length, n_crops=1):
         """Create random crops from segments at the last level. All cropped
         segments have the same length, their positions are sampled uniformly
@@ -390,22 +592,23 @@ class Well(AbstractWell, metaclass=SegmentDelegatingMeta):
         self : AbstractWell
             The well with cropped segments.
         """
+        # pylint: disable=protected-access
         length = parse_depth(length, check_positive=True, var_name="length")
         self._check_segment_lengths(length)
         wells = self.iter_level(-2)
-        p = np.array([sum([segment.length for segment in item]) for item in wells])
-        random_wells = Counter(np.random.choice(wells, n_crops, p=p/sum(p)))
-        for well in wells:
-            if well in random_wells:
-                n_well_crops = random_wells[well]
-                p = np.array([item.length for item in well])
-                random_segments = Counter(np.random.choice(well.segments, n_well_crops, p=p/sum(p)))
-                well.segments = [
-                    Well(segments=segment.random_crop(length, n_segment_crops))
-                    for segment, n_segment_crops in random_segments.items()
-                ]
+        segment_lengths = [well._segment_lengths for well in wells]
+        p = np.array([lengths.sum() for lengths in segment_lengths])
+        # Sample indices instead of objects and count them to get the number of crops for each item
+        n_wells_crops = np.bincount(np.random.choice(len(wells), n_crops, p=p/p.sum()), minlength=len(wells))
+        for well, p, n_well_crops in zip(wells, segment_lengths, n_wells_crops):
+            if n_well_crops:
+                n_segments_crops = np.bincount(np.random.choice(len(p), n_well_crops, p=p/p.sum()), minlength=len(p))
+                well._set_segments([
+                    Well._from_segments(segment.random_crop(length, n_segment_crops), self._tree_version)
+                    for segment, n_segment_crops in zip(well.segments, n_segments_crops) if n_segment_crops
+                ])
             else:
-                well.segments = []
+                well._set_segments([])
         return self.prune()
 
     def drop_short_segments(self, min_length):
@@ -424,10 +627,11 @@ class Well(AbstractWell, metaclass=SegmentDelegatingMeta):
         self : AbstractWell
             The well with dropped short segments.
         """
+        # pylint: disable=protected-access
         min_length = parse_depth(min_length, check_positive=True, var_name="min_length")
         wells = self.iter_level(-2)
         for well in wells:
-            well.segments = [segment for segment in well if segment.length >= min_length]
+            well._set_segments([segment for segment in well if segment.length >= min_length])
         return self.prune()
 
     def _aggregate_array(self, func, attr):
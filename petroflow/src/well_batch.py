@@ -1,8 +1,10 @@
 """Implements WellBatch class."""
 # pylint: disable=abstract-method
 
+import logging
 import traceback
 from functools import wraps
+from itertools import compress
 from collections import defaultdict
 
 import numpy as np
@@ -15,6 +17,9 @@ from .abstract_classes import AbstractWell
 from .exceptions import SkipWellException
 
 
+logger = logging.getLogger(__name__)
+
+
 class WellDelegatingMeta(BaseDelegator, MethodsTransformingMeta):
     """A metaclass to delegate calls to absent abstract methods of a
     `WellBatch` to `Well` objects in `wells` component."""
@@ -24,13 +29,14 @@ class WellDelegatingMeta(BaseDelegator, MethodsTransformingMeta):
         target = namespace["targets"][method]
         namespace[method] = mcls._make_parallel_action(method, target)
 
-    @staticmethod
-    def _make_parallel_action(name, target):
-        @wraps(getattr(Well, name))
-        def delegator(self, well, *args, **kwargs):
-            _ = self
-            return getattr(well, name)(*args, **kwargs)
-        return action(inbatch_parallel(init="wells", post="_filter_assemble", target=target)(delegator))
+    @classmethod
+    def _make_parallel_action(mcls, name, target):
+        template = """
+def delegator(self, pos, *args, **kwargs):
+    return self._get_well(pos).{name}(*args, **kwargs)
+"""
+        delegator = wraps(getattr(Well, name))(mcls._compile_delegator(template, name))
+        return action(inbatch_parallel(init="_well_positions", post="_filter_assemble", target=target)(delegator))
 
 
 class WellBatch(Batch, AbstractWell, metaclass=WellDelegatingMeta):
@@ -54,43 +60,92 @@ class WellBatch(Batch, AbstractWell, metaclass=WellDelegatingMeta):
     index : DatasetIndex
         Unique identifiers of wells in the batch.
     wells : 1-D ndarray
-        An array of `Well` instances.
+        An array of `Well` instances. Wells are loaded lazily: each of them is
+        created on the first action, applied to it, or when batch data is
+        accessed directly, e.g. via the `wells` attribute or `get` method.
 
     Note
     ----
-    Some batch methods take `well` as their first argument after `self`. You
-    should not specify it in your code since it will be implicitly passed by
-    `inbatch_parallel` decorator.
+    Batch methods, delegated to wells, take `pos` - a position of a well in
+    the batch - as their first argument after `self`. You should not specify
+    it in your code since it will be implicitly passed by `inbatch_parallel`
+    decorator.
     """
 
     components = ("wells",)
 
-    # inbatch_parallel target depending on action name
+    # inbatch_parallel target depending on action name. Actions, which only
+    # rearrange the segment tree and never load data from disk, are executed
+    # sequentially, since threads give no gain for them.
     targets = defaultdict(
         lambda: "threads",
         match_core_logs="for",
+        copy="for",
+        random_crop="for",
+        drop_short_segments="for",
     )
 
     def __init__(self, index, *args, preloaded=None, **kwargs):
+        # Whether all wells of the batch are loaded
+        self._wells_loaded = True
         super().__init__(index, *args, preloaded=preloaded, **kwargs)
+        self._well_kwargs = kwargs
         if preloaded is None:
-            self._init_wells(**kwargs)
-
-    @inbatch_parallel(init="indices", post="_filter_assemble", target="for")
-    def _init_wells(self, index, **kwargs):
-        """Init a well with its path from batch index."""
-        return Well(self.index.get_fullpath(index), **kwargs)
+            # `None` marks wells that are not loaded yet
+            self.wells = np.empty(len(self), dtype=object)
+            self._wells_loaded = False
+
+    @property
+    def data(self):
+        """Batch data. Not yet loaded wells are loaded on access, so that
+        all batch components and items, e.g. returned by `get`, contain only
+        `Well` instances."""
+        data = super().data
+        if not self._wells_loaded:
+            for pos in range(len(self)):
+                self._get_well(pos)
+            self._wells_loaded = True
+        return data
+
+    @property
+    def _well_positions(self):
+        """list of int: Positions of wells in the batch."""
+        return list(range(len(self)))
+
+    def _get_well(self, pos):
+        """Get a well by its position in the batch. Load the well with its
+        path from batch index if it is not loaded yet."""
+        # Batch data is accessed directly, since `data` property loads all wells
+        wells = super().data.wells
+        well = wells[pos]
+        if well is None:
+            well = Well(self.index.get_fullpath(self.indices[pos]), **self._well_kwargs)
+            wells[pos] = well
+        return well
 
     def _filter_assemble(self, results, *args, **kwargs):
-        skip_mask = np.array([isinstance(res, SkipWellException) for res in results])
-        if sum(skip_mask) == len(self):
+        n_results = len(results)
+        skip_mask = np.fromiter((isinstance(res, SkipWellException) for res in results), dtype=bool,
+                                count=n_results)
+        if skip_mask.all():
             raise SkipBatchException(str(results[0]))
-        results = np.array(results)[~skip_mask]  # pylint: disable=invalid-unary-operand-type
+        keep_mask = ~skip_mask
+        # Fill an object array element by element, since any conversion of a list makes numpy inspect
+        # each item as a possible sequence
+        kept_results = np.empty(n_results - skip_mask.sum(), dtype=object)
+        for i, res in enumerate(compress(results, keep_mask)):
+            kept_results[i] = res
+        results = kept_results
         if any_action_failed(results):
             errors = self.get_errors(results)
-            print(errors)
-            traceback.print_tb(errors[0].__traceback__)
+            logger.error("%s", errors)
+            # Format the traceback only if it will be emitted
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s", "".join(traceback.format_tb(errors[0].__traceback__)))
             raise RuntimeError("Could not assemble the batch")
-        self.index = self.index.create_subset(self.indices[~skip_mask])  # pylint: disable=invalid-unary-operand-type, attribute-defined-outside-init, line-too-long
+        # Each delegated action is applied to all wells, so all of them are loaded now. The flag
+        # must be set before `wells` assignment, which accesses `data` and would load skipped wells.
+        self._wells_loaded = True
+        self.index = self.index.create_subset(self.indices[keep_mask])  # pylint: disable=attribute-defined-outside-init
         self.wells = results    # pylint: disable=attribute-defined-outside-init
         return self
@@ -0,0 +1,36 @@
+"""Fixtures for petroflow tests."""
+# pylint: disable=redefined-outer-name
+
+import os
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def create_well_dir(path, name, depth_from, depth_to, logs_step=10):
+    """Create a directory with `meta.json` and `logs.csv` of a well."""
+    well_dir = os.path.join(path, name)
+    os.makedirs(well_dir)
+    meta = {"name": name, "field": "field", "depth_from": depth_from, "depth_to": depth_to}
+    with open(os.path.join(well_dir, "meta.json"), "w") as meta_file:
+        json.dump(meta, meta_file)
+    depth = np.arange(depth_from, depth_to, logs_step)
+    logs = pd.DataFrame({"DEPTH": depth, "GK": np.random.rand(len(depth))})
+    logs.to_csv(os.path.join(well_dir, "logs.csv"), index=False)
+    return well_dir
+
+
+@pytest.fixture
+def wells_dir(tmp_path):
+    """A directory with 3 wells, each 1000 cm long."""
+    for i in range(3):
+        create_well_dir(str(tmp_path), "well_{}".format(i), 1000 * (i + 1), 1000 * (i + 2))
+    return str(tmp_path)
+
+
+@pytest.fixture
+def well_path(wells_dir):
+    """A path to a well dir."""
+    return os.path.join(wells_dir, "well_0")
@@ -0,0 +1,77 @@
+"""Tests of segment tree caches of `Well`."""
+# pylint: disable=redefined-outer-name
+
+import pytest
+
+from petroflow import Well
+
+
+@pytest.fixture
+def cropped_well(well_path):
+    """A well with a tree of depth 4: the root, a single well with 2 wells
+    below it and 5 segments of 100 cm under each of them."""
+    well = Well(well_path).crop(500, 500, drop_last=True).crop(100, 100, drop_last=True)
+    # Fill cached properties of the root and the inner well
+    _ = well.tree_depth, well.n_segments, well.iter_level(-2)
+    _ = well.segments[0].n_segments
+    return well
+
+
+def test_cropped_well(cropped_well):
+    """Check the structure of the tree before any modifications."""
+    assert cropped_well.tree_depth == 4
+    assert cropped_well.n_segments == 10
+    assert len(cropped_well.iter_level(-2)) == 2
+
+
+def test_subtree_segments_change(cropped_well):
+    """Reassigning segments of a subtree must update cached properties of
+    all its ancestors."""
+    inner_well = cropped_well.segments[0]
+    leaves_parent = inner_well.segments[0]
+    leaves_parent.segments = leaves_parent.segments[:1]
+
+    expected_segments = leaves_parent.segments + inner_well.segments[1].segments
+    assert cropped_well.tree_depth == 4
+    assert cropped_well.n_segments == 6
+    assert inner_well.n_segments == 6
+    assert cropped_well.iter_level() == expected_segments
+    assert inner_well.iter_level() == expected_segments
+
+
+def test_subtree_depth_change(cropped_well):
+    """Increasing the depth of a subtree must update the depth of all its
+    ancestors."""
+    inner_well = cropped_well.segments[0]
+    inner_well.crop(50, 50, drop_last=True)
+
+    assert inner_well.tree_depth == 4
+    assert cropped_well.tree_depth == 5
+    assert cropped_well.n_segments == 20
+    assert len(cropped_well.iter_level(-2)) == 10
+    assert all(segment.length == 50 for segment in cropped_well.iter_level())
+
+
+def test_other_tree_change(cropped_well, well_path):
+    """Changing another tree must not reset cached properties."""
+    segments = cropped_well.iter_level()
+    other_well = Well(well_path).crop(500, 500, drop_last=True)
+    other_well.segments[0].segments = other_well.segments[0].segments[:1]
+
+    assert other_well.n_segments == 1
+    assert cropped_well.iter_level() is segments
+
+
+def test_fused_crop_short_segment(well_path):
+    """A failed length check of a fused crop must leave the tree intact."""
+    well = Well(well_path).crop(500, 500, drop_last=True).crop(250, 250, drop_last=True)
+    short_parent = well.iter_level(-2)[-1]
+    short_parent.segments = [short_parent.segments[0][1500:1600]]
+    segments = list(well.iter_level())
+    segments_parents = [list(parent.segments) for parent in well.iter_level(-2)]
+
+    with pytest.raises(ValueError):
+        well.apply_segment_transforms([("crop", {"length": 200, "step": 200, "drop_last": True})])
+    assert well.tree_depth == 4
+    assert well.iter_level() == segments
+    assert [parent.segments for parent in well.iter_level(-2)] == segments_parents
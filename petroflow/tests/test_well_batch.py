@@ -0,0 +1,44 @@
+"""Tests of lazy loading of wells in `WellBatch`."""
+# pylint: disable=redefined-outer-name
+
+import os
+
+import pytest
+
+from petroflow import Well, WellDataset
+
+
+@pytest.fixture
+def batch(wells_dir):
+    """A batch of 3 wells, that are not loaded yet."""
+    dataset = WellDataset(path=os.path.join(wells_dir, "*"), dirs=True)
+    return dataset.create_batch(dataset.indices)
+
+
+def test_data(batch):
+    """Batch data must contain loaded wells."""
+    wells = batch.data.wells
+    assert len(wells) == 3
+    assert all(isinstance(well, Well) for well in wells)
+
+
+def test_get_data(batch):
+    """Wells in batch data, returned by `get`, must be loaded."""
+    assert all(isinstance(well, Well) for well in batch.get().wells)
+    assert isinstance(batch.get()[0].wells, Well)
+
+
+def test_get_component(batch):
+    """Wells, returned by `get` as a component, must be loaded."""
+    assert all(isinstance(well, Well) for well in batch.get(component="wells"))
+
+
+def test_wells(batch):
+    """Wells must be loaded in the order of batch indices."""
+    assert [well.name for well in batch.wells] == list(batch.indices)
+
+
+def test_action(batch):
+    """An action must load and process all wells of the batch."""
+    batch = batch.crop(500, 500, drop_last=True)
+    assert [well.n_segments for well in batch.data.wells] == [2, 2, 2]